@@ -12,9 +12,7 @@ __status__ = "Development"
 import argparse
 import numpy as np
 import pygame
-import random
-from pygame import Rect
-from pygame.math import Vector2
+from collections import deque
 
 
 class MineSweeperGame:
@@ -53,7 +51,22 @@ class MineSweeperGame:
 
     CELL_SIZE_IN_PIXELS = 16
 
-    def __init__(self, boardWidth=9, boardHeight=9, minesNumber=10):
+    # Neighbor position offsets (line, column) constant definition
+    NEIGHBOR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+    # Input event constant definition
+    INPUT_EVENT_TYPES = [
+        pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.WINDOWEXPOSED
+    ]
+
+    LEFT_BUTTON = 1
+    MIDDLE_BUTTON = 2
+    RIGHT_BUTTON = 3
+
+    BUTTON_X_POSITION_INDEX = 0
+    BUTTON_Y_POSITION_INDEX = 1
+
+    def __init__(self, boardWidth=9, boardHeight=9, minesNumber=10, randomSeed=None):
         """Initialize the game board texture objects.
         """
 
@@ -65,10 +78,16 @@ class MineSweeperGame:
         self.boardHeight = boardHeight
         self.minesNumber = minesNumber
         self.minesUndiscovered = minesNumber
+        self.randomGenerator = np.random.default_rng(randomSeed)
 
         print("Creating a board with size of " + str(boardWidth) + "x" + str(boardHeight) + " cells and " +
               str(minesNumber) + " mines.")
 
+        # Precompute the neighbor positions of every cell (row-major)
+        self.neighborTable = [
+            self.computeNeighbors(line, column) for line in range(boardHeight) for column in range(boardWidth)
+        ]
+
         # Define the rendering properties
         self.windowWidth = self.LEFT_BORDER_WIDTH_IN_PIXELS
         self.windowWidth += (boardWidth * self.CELL_SIZE_IN_PIXELS)
@@ -78,44 +97,123 @@ class MineSweeperGame:
         self.windowHeight += (boardHeight * self.CELL_SIZE_IN_PIXELS)
         self.windowHeight += self.FOOTER_HEIGHT_IN_PIXELS
 
-        self.windowSize = Vector2(self.windowWidth, self.windowHeight)
-
-        self.displaySize = Vector2(self.DISPLAY_WIDTH_IN_PIXELS, self.DISPLAY_HEIGHT_IN_PIXELS)
-        self.displaySprite = pygame.image.load("./graphics/7-seg-sprite.png")
+        self.windowSize = (self.windowWidth, self.windowHeight)
 
         self.smilePositionX = (self.windowWidth / 2) - (self.SMILE_WIDTH_IN_PIXELS / 2) + 1
         self.smilePositionY = 12
-        self.smileSize = Vector2(self.SMILE_WIDTH_IN_PIXELS, self.SMILE_HEIGHT_IN_PIXELS)
-        self.smileSprite = pygame.image.load("./graphics/smile-sprite.png")
 
-        self.cellSize = Vector2(self.CELL_SIZE_IN_PIXELS, self.CELL_SIZE_IN_PIXELS)
-        self.cellSprite = pygame.image.load("./graphics/cell-sprite.png")
+        self.cellSize = (self.CELL_SIZE_IN_PIXELS, self.CELL_SIZE_IN_PIXELS)
+
+        # Precompute the board cell positions (row-major) inside the board surface, and the cell rects on the window
+        self.boardPosition = (self.LEFT_BORDER_WIDTH_IN_PIXELS, self.HEADER_HEIGHT_IN_PIXELS)
+        self.cellPositions = [((column * self.CELL_SIZE_IN_PIXELS), (line * self.CELL_SIZE_IN_PIXELS))
+                              for line in range(boardHeight)
+                              for column in range(boardWidth)]
+        self.cellRects = [
+            ((self.boardPosition[0] + x), (self.boardPosition[1] + y)) + self.cellSize for (x, y) in self.cellPositions
+        ]
 
         # Create the board window
-        self.window = pygame.display.set_mode((int(self.windowSize.x), int(self.windowSize.y)))
+        self.window = pygame.display.set_mode(self.windowSize)
+
+        # Load the sprites, converted once to the display pixel format (the sprites are fully opaque)
+        self.displaySprite = pygame.image.load("./graphics/7-seg-sprite.png").convert()
+        self.smileSprite = pygame.image.load("./graphics/smile-sprite.png").convert()
+        self.cellSprite = pygame.image.load("./graphics/cell-sprite.png").convert()
+        self.backgroundSprite = pygame.image.load("./graphics/background-sprite.png").convert()
+
+        # Slice the cell sprite into one surface per texture value
+        self.cellTiles = [
+            self.cellSprite.subsurface(
+                (value * self.CELL_SIZE_IN_PIXELS, 0, self.CELL_SIZE_IN_PIXELS, self.CELL_SIZE_IN_PIXELS))
+            for value in range(self.CELL_PRESSED_QUESTION_MARKED_VALUE + 1)
+        ]
+
+        # Also slice the display digits (0 to 9) and the smile button faces
+        self.displayTiles = [
+            self.displaySprite.subsurface(
+                (digit * self.DISPLAY_WIDTH_IN_PIXELS, 0, self.DISPLAY_WIDTH_IN_PIXELS, self.DISPLAY_HEIGHT_IN_PIXELS))
+            for digit in range(10)
+        ]
+        self.smileTiles = [
+            self.smileSprite.subsurface(
+                (index * self.SMILE_WIDTH_IN_PIXELS, 0, self.SMILE_WIDTH_IN_PIXELS, self.SMILE_HEIGHT_IN_PIXELS))
+            for index in range(self.smileSprite.get_width() // self.SMILE_WIDTH_IN_PIXELS)
+        ]
+
+        # Create the offscreen board surface, composed into the window as a single blit
+        self.boardSurface = pygame.Surface(
+            (boardWidth * self.CELL_SIZE_IN_PIXELS, boardHeight * self.CELL_SIZE_IN_PIXELS)).convert()
 
         # Load and set the game icon
         icon = pygame.image.load("./graphics/mine-icon.png")
         pygame.display.set_icon(icon)
         pygame.display.set_caption("Minesweeper")
 
+        # Only queue the events handled by the game (mouse motion and the other window events are dropped)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.INPUT_EVENT_TYPES)
+
         # Print the board background
         self.renderBackground()
 
         # Initialize the board values
-        self.boardVisibility = np.zeros((self.boardHeight, self.boardWidth))
-        # self.boardVisibility = np.ones((self.boardHeight, self.boardWidth))
-        self.boardValues = np.zeros((self.boardHeight, self.boardWidth))
+        self.boardVisibility = np.zeros((self.boardHeight, self.boardWidth), dtype=np.int8)
+        # self.boardVisibility = np.ones((self.boardHeight, self.boardWidth), dtype=np.int8)
+        self.boardValues = np.zeros((self.boardHeight, self.boardWidth), dtype=np.int8)
+        self.boardMines = np.zeros((self.boardHeight, self.boardWidth), dtype=bool)
+        self.boardSafeCells = ~self.boardMines
+
+        # Define the victory condition counters (mines not flagged nor marked, and flags without mines)
+        self.closedMinesNumber = minesNumber
+        self.wrongFlagsNumber = 0
+
+        # Define the cell texture lookup table, indexed by the cell visibility state and value
+        self.tileTable = np.zeros((self.CELL_PRESSED_CLOSED_STATE + 1, self.CELL_MINE_VALUE + 1), dtype=np.int8)
+        self.tileTable[self.CELL_CLOSED_STATE, :] = self.CELL_CLOSED_VALUE
+        self.tileTable[self.CELL_OPEN_STATE, :] = np.arange(self.CELL_MINE_VALUE + 1)
+        self.tileTable[self.CELL_BLOCKED_STATE, :] = self.CELL_FLAG_VALUE
+        self.tileTable[self.CELL_EXPLODED_MINE_STATE, :] = self.CELL_EXPLODED_MINE_VALUE
+        self.tileTable[self.CELL_WRONG_BLOCKED_STATE, :] = self.CELL_WRONG_FLAG_VALUE
+        self.tileTable[self.CELL_MARKED_STATE, :] = self.CELL_QUESTION_MARKED_VALUE
+        self.tileTable[self.CELL_PRESSED_MARKED_STATE, :] = self.CELL_PRESSED_QUESTION_MARKED_VALUE
+        self.tileTable[self.CELL_PRESSED_CLOSED_STATE, :] = self.CELL_EMPTY_VALUE
+
+        # Define the rendering control variables
+        self.boardTiles = np.full((self.boardHeight, self.boardWidth), -1, dtype=np.int8)
+        self.mineCounterRect = (14, 14, (3 * self.DISPLAY_WIDTH_IN_PIXELS), self.DISPLAY_HEIGHT_IN_PIXELS)
+        self.matchTimeRect = ((self.windowWidth - 54), 14, (3 * self.DISPLAY_WIDTH_IN_PIXELS),
+                              self.DISPLAY_HEIGHT_IN_PIXELS)
+        self.smileRect = (int(self.smilePositionX), self.smilePositionY, self.SMILE_WIDTH_IN_PIXELS,
+                          self.SMILE_HEIGHT_IN_PIXELS)
+        self.displayDigits = []
+        for number in range(1000):
+            hundreds, rest = divmod(number, 100)
+            self.displayDigits.append((hundreds,) + divmod(rest, 10))
+        self.displayedMineCounter = None
+        self.displayedMatchTimeS = None
+        self.displayedSmileIndex = None
+        self.fullWindowUpdate = True
 
         # Define the game time system
         self.matchStartTimeMs = pygame.time.get_ticks()
 
         # Define the input event variables
+        self.inputEventHandlers = {
+            pygame.QUIT: self.processQuitEvent,
+            pygame.KEYDOWN: self.processKeyDownEvent,
+            pygame.MOUSEBUTTONDOWN: self.processMouseButtonDownEvent,
+            pygame.MOUSEBUTTONUP: self.processMouseButtonUpEvent,
+            pygame.WINDOWEXPOSED: self.processWindowExposedEvent,
+        }
         self.isFirstClick = True
+        self.leftButtonEvent = False
+        self.rightButtonEvent = False
         self.leftButtonState = False
         self.rightButtonState = False
         self.smileButtonState = False
-        self.targetCell = Vector2()
+        self.targetLine = 0
+        self.targetColumn = 0
 
         # Define the control variables
         self.running = True
@@ -123,6 +221,19 @@ class MineSweeperGame:
         self.matchWin = False
 
     def getNeighbors(self, line, column):
+        """Return the selected cell neighbor positions from the precomputed neighbor table.
+
+        Args:
+            line (int): cell line coordinate.
+            column (int): cell column coordinate.
+
+        Returns:
+            tuple: the tuple of neighbor coordinates.
+        """
+
+        return self.neighborTable[(line * self.boardWidth) + column]
+
+    def computeNeighbors(self, line, column):
         """Identify the selected cell neighbor positions and returns it.
 
         Args:
@@ -130,89 +241,79 @@ class MineSweeperGame:
             column (int): cell column coordinate.
 
         Returns:
-            list: the list of neighbor coordinates.
+            tuple: the tuple of neighbor coordinates.
         """
 
         neighbors = []
 
-        for lineOffset in range(-1, 2):
-            for columnOffset in range(-1, 2):
+        for (lineOffset, columnOffset) in self.NEIGHBOR_OFFSETS:
 
-                # Get neighbor position
-                neighborLine = line + lineOffset
-                neighborColumn = column + columnOffset
+            # Get neighbor position
+            neighborLine = line + lineOffset
+            neighborColumn = column + columnOffset
 
-                # Discard invalid neighbors
-                if ((neighborLine < 0) or (neighborColumn < 0)):
-                    continue
-                if ((neighborLine >= self.boardHeight) or (neighborColumn >= self.boardWidth)):
-                    continue
-                if ((neighborLine == line) and (neighborColumn == column)):
-                    continue
+            # Keep only the neighbors inside the board
+            if ((0 <= neighborLine < self.boardHeight) and (0 <= neighborColumn < self.boardWidth)):
 
                 # Populate the neighbors list
-                neighbors.append([neighborLine, neighborColumn])
+                neighbors.append((neighborLine, neighborColumn))
 
-        return neighbors
+        return tuple(neighbors)
 
-    def generateBoard(self, initialLine, initialColumn):
-        """Generate a random board.
+    def countNeighborMines(self, mines):
+        """Count the mines around every board cell.
 
-        This method will generate a random board using the game configuration parameters. The initial cell coordinates
-        are guaranteed to not have a mine places on it.
+        The count is computed by adding the nine shifted views of the zero-padded mine mask, so the mine cells also
+        count themselves. Only the counts of cells without mines are meaningful.
 
         Args:
-            initialLine (int): The initial cell line coordinate.
-            initialColumn (int): the initial cell column coordinate.
-        """
-
-        # Reset the board state
-        self.boardVisibility = np.zeros((self.boardHeight, self.boardWidth))
-        self.boardValues = np.zeros((self.boardHeight, self.boardWidth))
-
-        # Place the required number of mines at random positions
-        remainingMines = self.minesNumber
-        while (remainingMines > 0):
+            mines (numpy.ndarray): the board mask of mine positions.
 
-            # Get a random line position
-            line = random.randint(0, (self.boardHeight - 1))
+        Returns:
+            numpy.ndarray: the number of mines around each cell (int8).
+        """
 
-            # Get the list of available cells on that line
-            columnList = []
-            for column, value in enumerate(self.boardValues[line]):
-                if ((value != self.CELL_MINE_VALUE) and (self.boardVisibility[line, column] != self.CELL_OPEN_STATE)):
-                    columnList.append(column)
+        paddedMines = np.pad(mines.astype(np.int8), 1)
+        minesFound = np.zeros((self.boardHeight, self.boardWidth), dtype=np.int8)
 
-            # Place the mine in the board
-            if (len(columnList) > 0):
-                column = int(random.choice(columnList))
+        for lineOffset in range(3):
+            for columnOffset in range(3):
+                minesFound += paddedMines[lineOffset:(lineOffset + self.boardHeight),
+                                          columnOffset:(columnOffset + self.boardWidth)]
 
-                # Skip if matched the initial position
-                if ((initialLine == line) and (initialColumn == column)):
-                    continue
+        return minesFound
 
-                self.boardValues[line, column] = self.CELL_MINE_VALUE
-                remainingMines -= 1
+    def generateBoard(self, initialLine, initialColumn):
+        """Generate a random board.
 
-        # Then, iterate over the board and update the board values
-        for (line, column), value in np.ndenumerate(self.boardValues):
+        This method will generate a random board using the game configuration parameters. The initial cell coordinates
+        are guaranteed to not have a mine places on it.
 
-            # Skip if the position has a mine
-            if (value == self.CELL_MINE_VALUE):
-                continue
+        Args:
+            initialLine (int): The initial cell line coordinate.
+            initialColumn (int): the initial cell column coordinate.
+        """
 
-            # Check each neighbor position for mines
-            minesFound = 0
-            neighbors = self.getNeighbors(line, column)
+        # Reset the board state, reusing the board buffers
+        self.boardVisibility.fill(self.CELL_CLOSED_STATE)
+        self.boardValues.fill(self.CELL_EMPTY_VALUE)
+        self.closedMinesNumber = self.minesNumber
+        self.wrongFlagsNumber = 0
 
-            for (neighborLine, neighborColumn) in neighbors:
+        # Place the required number of mines at distinct random positions, skipping the initial cell
+        initialIndex = (initialLine * self.boardWidth) + initialColumn
+        mineIndexes = self.randomGenerator.choice((self.boardHeight * self.boardWidth) - 1,
+                                                  size=self.minesNumber,
+                                                  replace=False)
+        mineIndexes[mineIndexes >= initialIndex] += 1
+        self.boardValues.flat[mineIndexes] = self.CELL_MINE_VALUE
 
-                # Check for mines
-                if (self.boardValues[neighborLine, neighborColumn] == self.CELL_MINE_VALUE):
-                    minesFound += 1
+        # Keep the mine position masks, which do not change until the next board is generated
+        np.equal(self.boardValues, self.CELL_MINE_VALUE, out=self.boardMines)
+        np.logical_not(self.boardMines, out=self.boardSafeCells)
 
-            # Update the cell value
-            self.boardValues[line, column] = minesFound
+        # Then, count the mines around each cell and update the cell values, keeping the mine positions
+        self.boardValues[self.boardSafeCells] = self.countNeighborMines(self.boardMines)[self.boardSafeCells]
 
     def renderBackground(self):
         """Function designed to print the game board background on screen.
@@ -221,80 +322,58 @@ class MineSweeperGame:
         # Clear the screen area (gray background)
         self.window.fill((192, 192, 192))
 
-        # Load the background sprites
-        backgroundSprite = pygame.image.load("./graphics/background-sprite.png")
-
-        # Print the borders
-        for x in range(self.LEFT_BORDER_WIDTH_IN_PIXELS, self.windowWidth - self.RIGHT_BORDER_WIDTH_IN_PIXELS + 1):
-            spritePoint = Vector2(x, 0)
-            texturePoint = Vector2(59, 0)
-            textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(1), int(self.HEADER_HEIGHT_IN_PIXELS))
-            self.window.blit(backgroundSprite, spritePoint, textureRect)
-
-        for x in range(self.LEFT_BORDER_WIDTH_IN_PIXELS, self.windowWidth - self.RIGHT_BORDER_WIDTH_IN_PIXELS + 1):
-            borderPosition = self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS
-            spritePoint = Vector2(x, borderPosition)
-            texturePoint = Vector2(11, 56)
-            textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(1), int(self.FOOTER_HEIGHT_IN_PIXELS))
-            self.window.blit(backgroundSprite, spritePoint, textureRect)
-
-        for y in range(self.HEADER_HEIGHT_IN_PIXELS, self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS + 1):
-            spritePoint = Vector2(0, y)
-            texturePoint = Vector2(0, 54)
-            textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(self.LEFT_BORDER_WIDTH_IN_PIXELS), int(1))
-            self.window.blit(backgroundSprite, spritePoint, textureRect)
-
-        for y in range(self.HEADER_HEIGHT_IN_PIXELS, self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS + 3):
-            borderPosition = self.windowWidth - self.RIGHT_BORDER_WIDTH_IN_PIXELS
-            spritePoint = Vector2(borderPosition, y)
-            texturePoint = Vector2(143, 54)
-            textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(self.RIGHT_BORDER_WIDTH_IN_PIXELS), int(1))
-            self.window.blit(backgroundSprite, spritePoint, textureRect)
+        backgroundSprite = self.backgroundSprite
+
+        # Print the borders, stretching each one pixel wide sprite strip over the whole border length
+        horizontalLength = self.windowWidth - self.RIGHT_BORDER_WIDTH_IN_PIXELS - self.LEFT_BORDER_WIDTH_IN_PIXELS + 1
+        verticalLength = self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS - self.HEADER_HEIGHT_IN_PIXELS + 1
+
+        strip = backgroundSprite.subsurface((59, 0, 1, self.HEADER_HEIGHT_IN_PIXELS))
+        strip = pygame.transform.scale(strip, (horizontalLength, self.HEADER_HEIGHT_IN_PIXELS))
+        self.window.blit(strip, (self.LEFT_BORDER_WIDTH_IN_PIXELS, 0))
+
+        strip = backgroundSprite.subsurface((11, 56, 1, self.FOOTER_HEIGHT_IN_PIXELS))
+        strip = pygame.transform.scale(strip, (horizontalLength, self.FOOTER_HEIGHT_IN_PIXELS))
+        self.window.blit(strip, (self.LEFT_BORDER_WIDTH_IN_PIXELS, self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS))
+
+        strip = backgroundSprite.subsurface((0, 54, self.LEFT_BORDER_WIDTH_IN_PIXELS, 1))
+        strip = pygame.transform.scale(strip, (self.LEFT_BORDER_WIDTH_IN_PIXELS, verticalLength))
+        self.window.blit(strip, (0, self.HEADER_HEIGHT_IN_PIXELS))
+
+        strip = backgroundSprite.subsurface((143, 54, self.RIGHT_BORDER_WIDTH_IN_PIXELS, 1))
+        strip = pygame.transform.scale(strip, (self.RIGHT_BORDER_WIDTH_IN_PIXELS, verticalLength + 2))
+        self.window.blit(strip, (self.windowWidth - self.RIGHT_BORDER_WIDTH_IN_PIXELS, self.HEADER_HEIGHT_IN_PIXELS))
 
         borderPosition = self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS
-        spritePoint = Vector2(0, borderPosition)
-        texturePoint = Vector2(0, 56)
-        textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(self.LEFT_BORDER_WIDTH_IN_PIXELS),
-                           int(self.FOOTER_HEIGHT_IN_PIXELS))
-        self.window.blit(backgroundSprite, spritePoint, textureRect)
+        textureRect = (0, 56, self.LEFT_BORDER_WIDTH_IN_PIXELS, self.FOOTER_HEIGHT_IN_PIXELS)
+        self.window.blit(backgroundSprite, (0, borderPosition), textureRect)
 
         # Print the header
-        spritePoint = Vector2(0, 0)
-        texturePoint = Vector2(0, 0)
-        textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(58), int(53))
-        self.window.blit(backgroundSprite, spritePoint, textureRect)
+        self.window.blit(backgroundSprite, (0, 0), (0, 0, 58, 53))
 
         smilePosition = (self.windowWidth / 2) - 13
-        spritePoint = Vector2(smilePosition, 0)
-        texturePoint = Vector2(61, 0)
-        textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(27), int(53))
-        self.window.blit(backgroundSprite, spritePoint, textureRect)
+        self.window.blit(backgroundSprite, (smilePosition, 0), (61, 0, 27, 53))
 
-        spritePoint = Vector2(self.windowWidth - 58, 0)
-        texturePoint = Vector2(93, 0)
-        textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(58), int(53))
-        self.window.blit(backgroundSprite, spritePoint, textureRect)
+        self.window.blit(backgroundSprite, (self.windowWidth - 58, 0), (93, 0, 58, 53))
 
     def render(self):
         """Function designed to print the game board on screen.
         """
 
-        # Print the number of undiscovered mines
-        mineCounter = self.minesUndiscovered
-        if (mineCounter < 0):
-            mineCounter = 0
+        updateRects = []
 
-        digits = [int(mineCounter / 100), int((mineCounter % 100) / 10), int(mineCounter % 10)]
+        # Print the number of undiscovered mines, when it has changed
+        mineCounter = min(max(self.minesUndiscovered, 0), 999)
 
-        for index, digit in enumerate(digits):
-            digitPosition = 14 + (index * 13)
-            spritePoint = Vector2(digitPosition, 14)
-            texturePoint = Vector2(digit, 0).elementwise() * self.displaySize
-            textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(self.displaySize.x),
-                               int(self.displaySize.y))
-            self.window.blit(self.displaySprite, spritePoint, textureRect)
+        if (mineCounter != self.displayedMineCounter):
+            self.displayedMineCounter = mineCounter
+            for index, digit in enumerate(self.displayDigits[mineCounter]):
+                digitPosition = 14 + (index * 13)
+                self.window.blit(self.displayTiles[digit], (digitPosition, 14))
 
-        # Print the smile button
+            updateRects.append(self.mineCounterRect)
+
+        # Print the smile button, when it has changed
         smileIndex = 0
         if (self.matchOngoing == False):
             if (self.matchWin == True):
@@ -304,56 +383,56 @@ class MineSweeperGame:
         elif (self.leftButtonState == True):
             smileIndex = 2
 
-        spritePoint = Vector2(self.smilePositionX, self.smilePositionY)
-        texturePoint = Vector2(smileIndex, 0).elementwise() * self.smileSize
-        textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(self.smileSize.x), int(self.smileSize.y))
-        self.window.blit(self.smileSprite, spritePoint, textureRect)
+        if (smileIndex != self.displayedSmileIndex):
+            self.displayedSmileIndex = smileIndex
+            self.window.blit(self.smileTiles[smileIndex], (self.smilePositionX, self.smilePositionY))
+            updateRects.append(self.smileRect)
 
         # Print the match running time
         if (self.matchOngoing == True):
             self.matchTimeMs = (pygame.time.get_ticks() - self.matchStartTimeMs)
 
         # Calculate the match time
-        matchTimeS = int(self.matchTimeMs / 1000)
-        digits = [int(matchTimeS % 10), int((matchTimeS % 100) / 10), int(matchTimeS / 100)]
-
-        # Print each display digit on screen
-        for index, digit in enumerate(digits):
-            digitPosition = self.windowWidth - 28 - (index * 13)
-            spritePoint = Vector2(digitPosition, 14)
-            texturePoint = Vector2(digit, 0).elementwise() * self.displaySize
-            textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(self.displaySize.x),
-                               int(self.displaySize.y))
-            self.window.blit(self.displaySprite, spritePoint, textureRect)
-
-        # Print the board tiles
-        for (line, column), value in np.ndenumerate(self.boardValues):
-
-            spriteOffset = Vector2(self.LEFT_BORDER_WIDTH_IN_PIXELS, self.HEADER_HEIGHT_IN_PIXELS)
-            spritePoint = (Vector2(column, line).elementwise() * self.cellSize) + spriteOffset
-
-            visibility = self.boardVisibility[line, column]
-            if (visibility == self.CELL_CLOSED_STATE):
-                texturePoint = Vector2(self.CELL_CLOSED_VALUE, 0).elementwise() * self.cellSize
-            elif (visibility == self.CELL_BLOCKED_STATE):
-                texturePoint = Vector2(self.CELL_FLAG_VALUE, 0).elementwise() * self.cellSize
-            elif (visibility == self.CELL_EXPLODED_MINE_STATE):
-                texturePoint = Vector2(self.CELL_EXPLODED_MINE_VALUE, 0).elementwise() * self.cellSize
-            elif (visibility == self.CELL_WRONG_BLOCKED_STATE):
-                texturePoint = Vector2(self.CELL_WRONG_FLAG_VALUE, 0).elementwise() * self.cellSize
-            elif ((visibility == self.CELL_MARKED_STATE)):
-                texturePoint = Vector2(self.CELL_QUESTION_MARKED_VALUE, 0).elementwise() * self.cellSize
-            elif ((visibility == self.CELL_PRESSED_MARKED_STATE)):
-                texturePoint = Vector2(self.CELL_PRESSED_QUESTION_MARKED_VALUE, 0).elementwise() * self.cellSize
-            elif ((visibility == self.CELL_PRESSED_CLOSED_STATE)):
-                texturePoint = Vector2(self.CELL_EMPTY_VALUE, 0).elementwise() * self.cellSize
-            else:
-                texturePoint = Vector2(value, 0).elementwise() * self.cellSize
+        matchTimeS = min(self.matchTimeMs // 1000, 999)
+
+        # Print each display digit on screen, when the time has changed
+        if (matchTimeS != self.displayedMatchTimeS):
+            self.displayedMatchTimeS = matchTimeS
+            for index, digit in enumerate(self.displayDigits[matchTimeS]):
+                digitPosition = self.windowWidth - 54 + (index * 13)
+                self.window.blit(self.displayTiles[digit], (digitPosition, 14))
+
+            updateRects.append(self.matchTimeRect)
 
-            textureRect = Rect(int(texturePoint.x), int(texturePoint.y), int(self.cellSize.x), int(self.cellSize.y))
-            self.window.blit(self.cellSprite, spritePoint, textureRect)
+        # Identify the texture of every board tile with a single lookup table gather
+        tiles = self.tileTable[self.boardVisibility, self.boardValues]
 
-        pygame.display.update()
+        # Repaint only the board tiles changed since the last frame, then print the board surface
+        changedIndexes = np.flatnonzero(tiles != self.boardTiles).tolist()
+        self.boardTiles = tiles
+
+        if (len(changedIndexes) > 0):
+            self.repaintCells(tiles.ravel().tolist(), changedIndexes)
+            self.window.blit(self.boardSurface, self.boardPosition)
+
+        # Update the window, restricted to the changed displays and tiles when possible
+        if (self.fullWindowUpdate == True):
+            self.fullWindowUpdate = False
+            pygame.display.update()
+        else:
+            updateRects += [self.cellRects[index] for index in changedIndexes]
+            pygame.display.update(updateRects)
+
+    def repaintCells(self, tiles, cellIndexes):
+        """Repaint the selected cells on the board surface with a single batched call.
+
+        Args:
+            tiles (list): the texture value of every board cell (row-major).
+            cellIndexes (list): the row-major indexes of the cells to repaint.
+        """
+
+        self.boardSurface.blits([(self.cellTiles[tiles[index]], self.cellPositions[index]) for index in cellIndexes],
+                                doreturn=0)
 
     def openCell(self, line, column, force):
         """Open the selected cell position.
@@ -365,55 +444,52 @@ class MineSweeperGame:
         """
 
         # First, check if the cell is still closed, then proceed opening it
-        if ((self.boardVisibility[line, column] == self.CELL_CLOSED_STATE) or (force == True)):
+        if ((self.boardVisibility[line, column] != self.CELL_CLOSED_STATE) and (force == False)):
+            return
 
-            self.boardVisibility[line, column] = self.CELL_OPEN_STATE
+        self.boardVisibility[line, column] = self.CELL_OPEN_STATE
 
-            # Also, if the opened cell value is zero, open it's neighbors
-            if (self.boardValues[line, column] == self.CELL_EMPTY_VALUE):
+        # Then, open the region around the empty cells iteratively, in breadth-first order. Cells are opened as they
+        # are reached, so every cell is visited once and only the empty ones are queued for expansion
+        if (self.boardValues[line, column] != self.CELL_EMPTY_VALUE):
+            return
 
-                neighbors = self.getNeighbors(line, column)
+        cellQueue = deque([(line, column)])
 
-                for (neighborLine, neighborColumn) in neighbors:
-                    self.openCell(neighborLine, neighborColumn, False)
+        while (len(cellQueue) > 0):
+            cellLine, cellColumn = cellQueue.popleft()
+
+            for (neighborLine, neighborColumn) in self.getNeighbors(cellLine, cellColumn):
+                if (self.boardVisibility[neighborLine, neighborColumn] != self.CELL_CLOSED_STATE):
+                    continue
+
+                self.boardVisibility[neighborLine, neighborColumn] = self.CELL_OPEN_STATE
+
+                if (self.boardValues[neighborLine, neighborColumn] == self.CELL_EMPTY_VALUE):
+                    cellQueue.append((neighborLine, neighborColumn))
 
     def openMines(self):
         """Open every closed mine position and indicate invalid flags.
         """
 
-        # Iterate over the board and mark the desired position
-        for (line, column), value in np.ndenumerate(self.boardValues):
+        closedMines = (self.boardVisibility == self.CELL_CLOSED_STATE) & self.boardMines
+        wrongFlags = (self.boardVisibility == self.CELL_BLOCKED_STATE) & self.boardSafeCells
 
-            visibility = self.boardVisibility[line, column]
-
-            if ((visibility == self.CELL_CLOSED_STATE) and (value == self.CELL_MINE_VALUE)):
-                self.boardVisibility[line, column] = self.CELL_OPEN_STATE
-
-            elif ((visibility == self.CELL_BLOCKED_STATE) and (value != self.CELL_MINE_VALUE)):
-                self.boardVisibility[line, column] = self.CELL_WRONG_BLOCKED_STATE
+        # Mark the desired positions over the whole board
+        self.boardVisibility[closedMines] = self.CELL_OPEN_STATE
+        self.boardVisibility[wrongFlags] = self.CELL_WRONG_BLOCKED_STATE
 
     def checkVictory(self):
         """Check for the game victory condition.
         """
 
-        # Iterate over the board and look for closed numbered positions
-        for (line, column), value in np.ndenumerate(self.boardValues):
-
-            visibility = self.boardVisibility[line, column]
-
-            # If there is any flag without mines, continue
-            if ((visibility == self.CELL_BLOCKED_STATE) and (value != self.CELL_MINE_VALUE)):
-                return
-
-            if ((visibility == self.CELL_CLOSED_STATE) and (value == self.CELL_MINE_VALUE)):
-                return
+        # If there is any flag without mines, or any mine still closed, continue
+        if ((self.wrongFlagsNumber > 0) or (self.closedMinesNumber > 0)):
+            return
 
         # Block (flag) every mine position and open undiscovered numbers
-        for (line, column), value in np.ndenumerate(self.boardValues):
-            if (value == self.CELL_MINE_VALUE):
-                self.boardVisibility[line, column] = self.CELL_BLOCKED_STATE
-            elif (value < self.CELL_MINE_VALUE):
-                self.boardVisibility[line, column] = self.CELL_OPEN_STATE
+        self.boardVisibility[self.boardMines] = self.CELL_BLOCKED_STATE
+        self.boardVisibility[self.boardSafeCells] = self.CELL_OPEN_STATE
 
         # Indicate every mine was discovered
         self.minesUndiscovered = 0
@@ -428,214 +504,286 @@ class MineSweeperGame:
         self.matchScore = int((self.minesNumber * 100) / (self.matchTimeMs / 1000))
         print("Match Score = " + str(self.matchScore) + " points!")
 
-    def processInput(self):
+    def processInput(self, events):
         """Process the user input commands.
+
+        Args:
+            events (list): the input events fetched from the event queue.
         """
 
-        LEFT_BUTTON_INDEX = 0
-        RIGHT_BUTTON_INDEX = 2
+        self.leftButtonEvent = False
+        self.rightButtonEvent = False
 
-        BUTTON_X_POSITION_INDEX = 0
-        BUTTON_Y_POSITION_INDEX = 1
+        # Event handling, dispatch each fetched event to its handler
+        for event in events:
 
-        leftButtonEvent = False
-        rightButtonEvent = False
+            eventHandler = self.inputEventHandlers.get(event.type)
+            if (eventHandler is None):
+                continue
 
-        # Event handling, get events from the event queue
-        for event in pygame.event.get():
+            boardEvent = eventHandler(event)
 
-            boardEvent = False
+            # In case the match has already ended, skip the game button actions
+            if (self.matchOngoing == False):
+                continue
 
-            # Check for the exit event condition (Window Close)
-            if (event.type == pygame.QUIT):
-                # Change the control flag to False and exit the main loop
-                self.running = False
+            # Also, check if the event is inside the board boundaries
+            if (boardEvent == False):
                 continue
 
-            # Check for the exit event condition (ESC Key)
-            elif (event.type == pygame.KEYDOWN):
+            self.processBoardEvent()
 
-                if (event.key == pygame.K_ESCAPE):
-                    # Change the control flag to False and exit the main loop
-                    self.running = False
-                    continue
+    def processQuitEvent(self, event):
+        """Process the exit event condition (Window Close).
 
-            # Check for click events and identify which button was pressed
-            elif (event.type == pygame.MOUSEBUTTONDOWN):
+        Args:
+            event (pygame.event.Event): the quit event.
 
-                button = pygame.mouse.get_pressed()
+        Returns:
+            bool: whether the event targets the board (always False).
+        """
 
-                if ((button[LEFT_BUTTON_INDEX] == True) and (self.leftButtonState == False)):
-                    leftButtonEvent = True
-                    self.leftButtonState = True
+        # Change the control flag to False and exit the main loop
+        self.running = False
+        return False
 
-                if ((button[RIGHT_BUTTON_INDEX] == True) and (self.rightButtonState == False)):
-                    rightButtonEvent = True
-                    self.rightButtonState = True
+    def processKeyDownEvent(self, event):
+        """Process the exit event condition (ESC Key).
 
-                mousePosition = pygame.mouse.get_pos()
+        Args:
+            event (pygame.event.Event): the key press event.
 
-                # First, check if the click event is inside the board boundaries
-                if ((mousePosition[BUTTON_Y_POSITION_INDEX] >= self.HEADER_HEIGHT_IN_PIXELS) and
-                    (mousePosition[BUTTON_Y_POSITION_INDEX] < (self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS)) and
-                    (mousePosition[BUTTON_X_POSITION_INDEX] >= self.LEFT_BORDER_WIDTH_IN_PIXELS) and
-                    (mousePosition[BUTTON_X_POSITION_INDEX] < (self.windowWidth - self.RIGHT_BORDER_WIDTH_IN_PIXELS))):
+        Returns:
+            bool: whether the event targets the board (always False).
+        """
 
-                    boardEvent = True
+        if (event.key == pygame.K_ESCAPE):
+            # Change the control flag to False and exit the main loop
+            self.running = False
 
-                    # Then, calculate the cell position
-                    self.targetCell.x = (mousePosition[BUTTON_X_POSITION_INDEX] - self.LEFT_BORDER_WIDTH_IN_PIXELS)
-                    self.targetCell.x = int(self.targetCell.x / self.CELL_SIZE_IN_PIXELS)
-                    self.targetCell.y = (mousePosition[BUTTON_Y_POSITION_INDEX] - self.HEADER_HEIGHT_IN_PIXELS)
-                    self.targetCell.y = int(self.targetCell.y / self.CELL_SIZE_IN_PIXELS)
+        return False
 
-                # Also, check if the click event is inside the smile boundaries
-                elif ((mousePosition[BUTTON_Y_POSITION_INDEX] >= self.smilePositionY) and
-                      (mousePosition[BUTTON_Y_POSITION_INDEX] < (self.smilePositionY + self.SMILE_HEIGHT_IN_PIXELS)) and
-                      (mousePosition[BUTTON_X_POSITION_INDEX] >= self.smilePositionX) and
-                      (mousePosition[BUTTON_X_POSITION_INDEX] < (self.smilePositionX + self.SMILE_WIDTH_IN_PIXELS))):
+    def processWindowExposedEvent(self, event):
+        """Process the window exposed event, requesting a full window update on the next render.
 
-                    self.smileButtonState = False
+        Args:
+            event (pygame.event.Event): the window exposed event.
 
-                    # Reset the board
-                    self.boardVisibility = np.zeros((self.boardHeight, self.boardWidth))
-                    # Reset the control variables
-                    self.matchStartTimeMs = pygame.time.get_ticks()
-                    self.isFirstClick = True
-                    self.matchOngoing = True
-                    self.matchWin = False
+        Returns:
+            bool: whether the event targets the board (always False).
+        """
 
-                # TODO: remove after testing - middle mouse button will close every cell
-                if (button[1]):
-                    # Reset the board
-                    self.boardVisibility = np.zeros((self.boardHeight, self.boardWidth))
-                    # Reset the control variables
-                    self.matchStartTimeMs = pygame.time.get_ticks()
-                    self.matchOngoing = True
-                    self.matchWin = False
+        self.fullWindowUpdate = True
+        return False
 
-            # Check for release events and identify which button was released
-            elif (event.type == pygame.MOUSEBUTTONUP):
+    def processMouseButtonDownEvent(self, event):
+        """Process the click events and identify which button was pressed.
 
-                button = pygame.mouse.get_pressed()
+        Args:
+            event (pygame.event.Event): the mouse button press event.
 
-                if ((button[LEFT_BUTTON_INDEX] == False) and (self.leftButtonState == True)):
-                    leftButtonEvent = True
-                    self.leftButtonState = False
+        Returns:
+            bool: whether the click event is inside the board boundaries.
+        """
 
-                if ((button[RIGHT_BUTTON_INDEX] == False) and (self.rightButtonState == True)):
-                    rightButtonEvent = True
-                    self.rightButtonState = False
+        boardEvent = False
 
-                mousePosition = pygame.mouse.get_pos()
+        if ((event.button == self.LEFT_BUTTON) and (self.leftButtonState == False)):
+            self.leftButtonEvent = True
+            self.leftButtonState = True
 
-                # Also, check if the release event is inside the board boundaries
-                if ((mousePosition[BUTTON_Y_POSITION_INDEX] >= self.HEADER_HEIGHT_IN_PIXELS) and
-                    (mousePosition[BUTTON_Y_POSITION_INDEX] < (self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS)) and
-                    (mousePosition[BUTTON_X_POSITION_INDEX] >= self.LEFT_BORDER_WIDTH_IN_PIXELS) and
-                    (mousePosition[BUTTON_X_POSITION_INDEX] < (self.windowWidth - self.RIGHT_BORDER_WIDTH_IN_PIXELS))):
+        if ((event.button == self.RIGHT_BUTTON) and (self.rightButtonState == False)):
+            self.rightButtonEvent = True
+            self.rightButtonState = True
 
-                    boardEvent = True
+        mousePosition = event.pos
 
-                # Also, check if the release event is inside the smile boundaries
-                elif ((mousePosition[BUTTON_Y_POSITION_INDEX] >= self.smilePositionY) and
-                      (mousePosition[BUTTON_Y_POSITION_INDEX] < (self.smilePositionY + self.SMILE_HEIGHT_IN_PIXELS)) and
-                      (mousePosition[BUTTON_X_POSITION_INDEX] >= self.smilePositionX) and
-                      (mousePosition[BUTTON_X_POSITION_INDEX] < (self.smilePositionX + self.SMILE_WIDTH_IN_PIXELS))):
+        # First, check if the click event is inside the board boundaries
+        if ((mousePosition[self.BUTTON_Y_POSITION_INDEX] >= self.HEADER_HEIGHT_IN_PIXELS) and
+            (mousePosition[self.BUTTON_Y_POSITION_INDEX] < (self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS)) and
+            (mousePosition[self.BUTTON_X_POSITION_INDEX] >= self.LEFT_BORDER_WIDTH_IN_PIXELS) and
+            (mousePosition[self.BUTTON_X_POSITION_INDEX] < (self.windowWidth - self.RIGHT_BORDER_WIDTH_IN_PIXELS))):
 
-                    self.smileButtonState = True
+            boardEvent = True
 
-            # In case the match has already ended, skip the game button actions
-            if (self.matchOngoing == False):
-                continue
+            # Then, calculate the cell position
+            self.targetColumn = (mousePosition[self.BUTTON_X_POSITION_INDEX] - self.LEFT_BORDER_WIDTH_IN_PIXELS)
+            self.targetColumn //= self.CELL_SIZE_IN_PIXELS
+            self.targetLine = (mousePosition[self.BUTTON_Y_POSITION_INDEX] - self.HEADER_HEIGHT_IN_PIXELS)
+            self.targetLine //= self.CELL_SIZE_IN_PIXELS
 
-            # Also, check if the event is inside the board boundaries
-            if (boardEvent == False):
-                continue
+        # Also, check if the click event is inside the smile boundaries
+        elif ((mousePosition[self.BUTTON_Y_POSITION_INDEX] >= self.smilePositionY) and
+              (mousePosition[self.BUTTON_Y_POSITION_INDEX] < (self.smilePositionY + self.SMILE_HEIGHT_IN_PIXELS)) and
+              (mousePosition[self.BUTTON_X_POSITION_INDEX] >= self.smilePositionX) and
+              (mousePosition[self.BUTTON_X_POSITION_INDEX] < (self.smilePositionX + self.SMILE_WIDTH_IN_PIXELS))):
 
-            # Cast the target coordinated to integers
-            targetLine = int(self.targetCell.y)
-            targetColumn = int(self.targetCell.x)
+            self.smileButtonState = False
 
-            # Process the button press events
-            if ((leftButtonEvent == True) and (self.leftButtonState == True)):
+            # Reset the board
+            self.boardVisibility.fill(self.CELL_CLOSED_STATE)
+            # Reset the control variables
+            self.matchStartTimeMs = pygame.time.get_ticks()
+            self.isFirstClick = True
+            self.matchOngoing = True
+            self.matchWin = False
 
-                leftButtonEvent = False
+        # TODO: remove after testing - middle mouse button will close every cell
+        if (event.button == self.MIDDLE_BUTTON):
+            # Reset the board
+            self.boardVisibility.fill(self.CELL_CLOSED_STATE)
+            self.closedMinesNumber = self.minesNumber
+            self.wrongFlagsNumber = 0
+            # Reset the control variables
+            self.matchStartTimeMs = pygame.time.get_ticks()
+            self.matchOngoing = True
+            self.matchWin = False
 
-                if (self.boardVisibility[targetLine, targetColumn] == self.CELL_CLOSED_STATE):
-                    self.boardVisibility[targetLine, targetColumn] = self.CELL_PRESSED_CLOSED_STATE
+        return boardEvent
 
-                if (self.boardVisibility[targetLine, targetColumn] == self.CELL_MARKED_STATE):
-                    self.boardVisibility[targetLine, targetColumn] = self.CELL_PRESSED_MARKED_STATE
+    def processMouseButtonUpEvent(self, event):
+        """Process the release events and identify which button was released.
 
-            if ((rightButtonEvent == True) and (self.rightButtonState == True)):
+        Args:
+            event (pygame.event.Event): the mouse button release event.
 
-                rightButtonEvent = False
+        Returns:
+            bool: whether the release event is inside the board boundaries.
+        """
 
-            # Process the open cell event at button release
-            if ((leftButtonEvent == True) and (self.leftButtonState == False)):
+        boardEvent = False
 
-                leftButtonEvent = False
+        if ((event.button == self.LEFT_BUTTON) and (self.leftButtonState == True)):
+            self.leftButtonEvent = True
+            self.leftButtonState = False
 
-                # In case this is the first click for the match, generate the board
-                if (self.isFirstClick == True):
-                    self.isFirstClick = False
-                    self.generateBoard(targetLine, targetColumn)
-                    self.openCell(targetLine, targetColumn, True)
-                    continue
+        if ((event.button == self.RIGHT_BUTTON) and (self.rightButtonState == True)):
+            self.rightButtonEvent = True
+            self.rightButtonState = False
+
+        mousePosition = event.pos
+
+        # Also, check if the release event is inside the board boundaries
+        if ((mousePosition[self.BUTTON_Y_POSITION_INDEX] >= self.HEADER_HEIGHT_IN_PIXELS) and
+            (mousePosition[self.BUTTON_Y_POSITION_INDEX] < (self.windowHeight - self.FOOTER_HEIGHT_IN_PIXELS)) and
+            (mousePosition[self.BUTTON_X_POSITION_INDEX] >= self.LEFT_BORDER_WIDTH_IN_PIXELS) and
+            (mousePosition[self.BUTTON_X_POSITION_INDEX] < (self.windowWidth - self.RIGHT_BORDER_WIDTH_IN_PIXELS))):
+
+            boardEvent = True
+
+        # Also, check if the release event is inside the smile boundaries
+        elif ((mousePosition[self.BUTTON_Y_POSITION_INDEX] >= self.smilePositionY) and
+              (mousePosition[self.BUTTON_Y_POSITION_INDEX] < (self.smilePositionY + self.SMILE_HEIGHT_IN_PIXELS)) and
+              (mousePosition[self.BUTTON_X_POSITION_INDEX] >= self.smilePositionX) and
+              (mousePosition[self.BUTTON_X_POSITION_INDEX] < (self.smilePositionX + self.SMILE_WIDTH_IN_PIXELS))):
+
+            self.smileButtonState = True
 
-                # Next, check if the opened cell is a mine
-                value = self.boardValues[targetLine, targetColumn]
+        return boardEvent
 
-                if (self.boardVisibility[targetLine, targetColumn] == self.CELL_PRESSED_CLOSED_STATE):
+    def processBoardEvent(self):
+        """Process the button actions over the target board cell.
+        """
+
+        targetLine = self.targetLine
+        targetColumn = self.targetColumn
+
+        # Process the button press events
+        if ((self.leftButtonEvent == True) and (self.leftButtonState == True)):
+
+            self.leftButtonEvent = False
 
-                    # Process the closed cell event
-                    if (value == self.CELL_MINE_VALUE):
-                        # If the selected cell is a mine, explode it and open every other
-                        self.boardVisibility[targetLine, targetColumn] = self.CELL_EXPLODED_MINE_STATE
-                        self.openMines()
-                        # End the match (defeat)
-                        self.matchTimeMs = (pygame.time.get_ticks() - self.matchStartTimeMs)
-                        self.matchOngoing = False
-                        self.matchWin = False
-                        print("Game Over. You Lose!")
+            if (self.boardVisibility[targetLine, targetColumn] == self.CELL_CLOSED_STATE):
+                self.boardVisibility[targetLine, targetColumn] = self.CELL_PRESSED_CLOSED_STATE
 
-                    else:
-                        # Otherwise, open the cell as usual
-                        self.boardVisibility[targetLine, targetColumn] = self.CELL_CLOSED_STATE
-                        self.openCell(targetLine, targetColumn, False)
+                # A pressed mine no longer counts as closed for the victory condition
+                if (self.boardMines[targetLine, targetColumn]):
+                    self.closedMinesNumber -= 1
 
-                        # And, check if the game has ended in victory
-                        self.checkVictory()
+            if (self.boardVisibility[targetLine, targetColumn] == self.CELL_MARKED_STATE):
+                self.boardVisibility[targetLine, targetColumn] = self.CELL_PRESSED_MARKED_STATE
 
-                if (self.boardVisibility[targetLine, targetColumn] == self.CELL_PRESSED_MARKED_STATE):
-                    # Process the marked cell event
-                    self.boardVisibility[targetLine, targetColumn] = self.CELL_MARKED_STATE
+        if ((self.rightButtonEvent == True) and (self.rightButtonState == True)):
 
-            # Process the block cell event at button release
-            if ((rightButtonEvent == True) and (self.rightButtonState == False)):
+            self.rightButtonEvent = False
 
-                rightButtonEvent = False
+        # Process the open cell event at button release
+        if ((self.leftButtonEvent == True) and (self.leftButtonState == False)):
 
-                # In case this is the first click for the match, generate the board
-                if (self.isFirstClick == True):
-                    self.isFirstClick = False
-                    self.generateBoard(targetLine, targetColumn)
+            self.leftButtonEvent = False
 
-                # Next, process the event
-                if (self.boardVisibility[targetLine, targetColumn] == self.CELL_CLOSED_STATE):
-                    self.boardVisibility[targetLine, targetColumn] = self.CELL_BLOCKED_STATE
-                    self.minesUndiscovered -= 1
+            # In case this is the first click for the match, generate the board
+            if (self.isFirstClick == True):
+                self.isFirstClick = False
+                self.generateBoard(targetLine, targetColumn)
+                self.openCell(targetLine, targetColumn, True)
+                return
+
+            # Next, check if the opened cell is a mine
+            value = self.boardValues[targetLine, targetColumn]
 
-                elif (self.boardVisibility[targetLine, targetColumn] == self.CELL_BLOCKED_STATE):
-                    self.boardVisibility[targetLine, targetColumn] = self.CELL_MARKED_STATE
-                    self.minesUndiscovered += 1
+            if (self.boardVisibility[targetLine, targetColumn] == self.CELL_PRESSED_CLOSED_STATE):
+
+                # Process the closed cell event
+                if (value == self.CELL_MINE_VALUE):
+                    # If the selected cell is a mine, explode it and open every other
+                    self.boardVisibility[targetLine, targetColumn] = self.CELL_EXPLODED_MINE_STATE
+                    self.openMines()
+                    # End the match (defeat)
+                    self.matchTimeMs = (pygame.time.get_ticks() - self.matchStartTimeMs)
+                    self.matchOngoing = False
+                    self.matchWin = False
+                    print("Game Over. You Lose!")
 
-                elif (self.boardVisibility[targetLine, targetColumn] == self.CELL_MARKED_STATE):
+                else:
+                    # Otherwise, open the cell as usual
                     self.boardVisibility[targetLine, targetColumn] = self.CELL_CLOSED_STATE
+                    self.openCell(targetLine, targetColumn, False)
 
-                # And, check if the game has ended in victory
-                self.checkVictory()
+                    # And, check if the game has ended in victory
+                    self.checkVictory()
+
+            if (self.boardVisibility[targetLine, targetColumn] == self.CELL_PRESSED_MARKED_STATE):
+                # Process the marked cell event
+                self.boardVisibility[targetLine, targetColumn] = self.CELL_MARKED_STATE
+
+        # Process the block cell event at button release
+        if ((self.rightButtonEvent == True) and (self.rightButtonState == False)):
+
+            self.rightButtonEvent = False
+
+            # In case this is the first click for the match, generate the board
+            if (self.isFirstClick == True):
+                self.isFirstClick = False
+                self.generateBoard(targetLine, targetColumn)
+
+            # Next, process the event and update the victory condition counters
+            isMine = self.boardMines[targetLine, targetColumn]
+
+            if (self.boardVisibility[targetLine, targetColumn] == self.CELL_CLOSED_STATE):
+                self.boardVisibility[targetLine, targetColumn] = self.CELL_BLOCKED_STATE
+                self.minesUndiscovered -= 1
+
+                if (isMine):
+                    self.closedMinesNumber -= 1
+                else:
+                    self.wrongFlagsNumber += 1
+
+            elif (self.boardVisibility[targetLine, targetColumn] == self.CELL_BLOCKED_STATE):
+                self.boardVisibility[targetLine, targetColumn] = self.CELL_MARKED_STATE
+                self.minesUndiscovered += 1
+
+                if (not isMine):
+                    self.wrongFlagsNumber -= 1
+
+            elif (self.boardVisibility[targetLine, targetColumn] == self.CELL_MARKED_STATE):
+                self.boardVisibility[targetLine, targetColumn] = self.CELL_CLOSED_STATE
+
+                if (isMine):
+                    self.closedMinesNumber += 1
+
+            # And, check if the game has ended in victory
+            self.checkVictory()
 
     def run(self):
         """Function designed to run the game application.
@@ -644,7 +792,19 @@ class MineSweeperGame:
         # Run the main loop
         while self.running:
             self.render()
-            self.processInput()
+
+            # Sleep until an input event arrives or, during the match, until the next timer second
+            if (self.matchOngoing == True):
+                matchTimeMs = (pygame.time.get_ticks() - self.matchStartTimeMs)
+                event = pygame.event.wait(1000 - (matchTimeMs % 1000))
+            else:
+                event = pygame.event.wait()
+
+            events = pygame.event.get(self.INPUT_EVENT_TYPES)
+            if (event.type != pygame.NOEVENT):
+                events.insert(0, event)
+
+            self.processInput(events)
 
 
 def main(args):
@@ -700,7 +860,7 @@ def main(args):
         minesNumber = EASY_MINES
 
     # Create the game instance and run
-    game = MineSweeperGame(boardWidth, boardHeight, minesNumber)
+    game = MineSweeperGame(boardWidth, boardHeight, minesNumber, args.seed)
     game.run()
 
 
@@ -716,6 +876,11 @@ if __name__ == "__main__":
                         choices=['easy', 'medium', 'hard'],
                         default='',
                         help='Define the game difficulty')
+    parser.add_argument('-s',
+                        '--seed',
+                        type=int,
+                        default=None,
+                        help='Define the random seed used to generate the boards')
 
     # Parse the input arguments
     args = parser.parse_args()